@@ -0,0 +1,65 @@
+# api_client.py
+# api_server.py에 요청하는 원격 예측기. Streamlit 앱이 모델 없이 얇은 클라이언트로 동작할 때 사용
+import json, time, urllib.request, urllib.error
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+
+
+class RemotePredictor:
+    """FastaiPredictor/LeanPredictor와 같은 predict / predict_batch 인터페이스.
+
+    입력이 bytes면 업로드 원본을 그대로 보낸다 (재인코딩 없음). 503이면 Retry-After에 맞춰 재시도.
+    """
+    name = "remote"
+
+    def __init__(self, base_url: str, timeout: float = 30.0, workers: int = 4, retries: int = 5):
+        self.base_url = base_url.rstrip("/")
+        self.timeout, self.workers, self.retries = timeout, workers, retries
+        info = self._get("/labels")
+        self.vocab = list(info["labels"])
+        self.input_size = tuple(info["input_size"]) if info.get("input_size") else None
+        self.model_id = f"{self.base_url}:{info.get('model_id', '')}"
+
+    def _get(self, path: str) -> dict:
+        with urllib.request.urlopen(self.base_url + path, timeout=self.timeout) as r:
+            return json.loads(r.read())
+
+    def predict_bytes(self, b: bytes) -> dict:
+        req = urllib.request.Request(self.base_url + "/predict", data=b, method="POST",
+                                     headers={"Content-Type": "application/octet-stream"})
+        for attempt in range(self.retries + 1):
+            try:
+                with urllib.request.urlopen(req, timeout=self.timeout) as r:
+                    return json.loads(r.read())
+            except urllib.error.HTTPError as e:
+                body = e.read()
+                if e.code == 503 and attempt < self.retries:
+                    # 서버 대기열이 가득 참: Retry-After(초) 또는 지수 백오프 후 재시도
+                    try:
+                        wait = float(e.headers.get("Retry-After", ""))
+                    except ValueError:
+                        wait = 0.25 * 2 ** attempt
+                    time.sleep(min(wait, 10.0))
+                    continue
+                try:
+                    msg = json.loads(body or b"{}").get("error", e.reason)
+                except ValueError:
+                    msg = e.reason
+                raise RuntimeError(f"예측 서버 오류 {e.code}: {msg}") from None
+
+    def predict(self, x: bytes | Image.Image):
+        if isinstance(x, (bytes, bytearray)):
+            b = bytes(x)
+        else:
+            # PIL만 있는 경우(예: 예열)에만 무손실 PNG로 인코딩
+            buf = BytesIO()
+            x.save(buf, "PNG")
+            b = buf.getvalue()
+        r = self.predict_bytes(b)
+        return r["label"], int(r["index"]), [float(r["probs"][l]) for l in self.vocab]
+
+    def predict_batch(self, items):
+        # 동시 요청은 서버의 동적 배처가 한 번의 forward로 묶는다. 동시성은 workers로 제한
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(self.predict, items))
@@ -0,0 +1,198 @@
+# api_server.py
+# Streamlit 없이 쓰는 예측 HTTP 서버. 같은 모델 파일/라벨 콘텐츠를 사용하고, 동시 요청은 동적 배처로 묶는다.
+#   python api_server.py --port 8000 [--mode lean] [--max-batch 16 --max-wait-ms 5 --max-queue 256] [--no-batch]
+#
+#   POST /predict   본문: 이미지 바이트 (또는 JSON {"image_b64": ...})
+#                   응답: {"label", "index", "probs": {라벨: 확률}, "content": {...}, "cached"}
+#   GET  /labels    {"labels", "input_size", "model_id"}
+#   GET  /health    상태 + 배처/캐시 통계
+#   GET  /metrics   Prometheus 텍스트 형식 지표 (단계별 지연시간 히스토그램, 캐시/배처/시작 시간)
+import os, time, json, base64, argparse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from startup import ModelStartup
+from pred_cache import PredictionCache, model_identity, image_key
+from ingest import ingest_image, IngestError, MAX_BYTES
+from batcher import DynamicBatcher, QueueFull
+from content_store import ContentStore
+from metrics import REGISTRY, stage
+
+DEFAULT_FILE_ID = "14jGzKTiAdbBHoZkgAjl6RO3npVLFqH6k"
+
+
+class PredictService:
+    """모델 로드 + (선택) 동적 배처 + 예측 캐시. HTTP 핸들러와 분리해 재사용."""
+
+    def __init__(self, args):
+        self.startup = ModelStartup(args.file_id, args.model_path, args.mode, args.threads, args.sha256).start()
+        self.startup.wait()
+        if self.startup.error is not None:
+            raise self.startup.error
+        self.predictor = self.startup.predictor
+        self.labels = list(self.predictor.vocab)
+        self.model_id = model_identity(args.model_path)
+        size = self.startup.input_size
+        self.min_side = max(size) if size else 224
+        self.cache = PredictionCache(max_items=args.cache_max)
+        self.batcher = None if args.no_batch else DynamicBatcher(
+            self.predictor.predict_batch, args.max_batch, args.max_wait_ms, args.max_queue)
+        self.timeout = args.timeout
+        self.content = None
+        if args.content and os.path.exists(args.content):
+            self.content = ContentStore(args.content, self.labels)  # raw()만 사용: 썸네일 캐시 불필요
+        REGISTRY.add_gauges(self._gauges)
+
+    def _gauges(self) -> dict:
+        g = {(f"pred_cache_{k}", ()): v for k, v in self.cache.stats().items() if k != "max_items"}
+        for k, v in self.startup.timings.items():
+            g[("startup_seconds", (("stage", k),))] = v
+        if self.batcher is not None:
+            for k, v in self.batcher.stats().items():
+                g[(f"batcher_{k}", ())] = v
+        return g
+
+    def predict_bytes(self, b: bytes) -> dict:
+        key = image_key(b, f"{self.model_id}:{self.predictor.name}")
+        cached = self.cache.get(key)
+        if cached is None:
+            with stage("decode"):
+                pil = ingest_image(b, min_side=self.min_side)
+            if self.batcher is not None:
+                cached = self.batcher.submit(pil).result(timeout=self.timeout)
+            else:
+                cached = self.predictor.predict(pil)
+            self.cache.put(key, cached)
+            hit = False
+        else:
+            hit = True
+        REGISTRY.inc("predictions_total", cache="hit" if hit else "miss")
+        pred, idx, probs = cached
+        return {
+            "label": pred, "index": idx,
+            "probs": dict(zip(self.labels, probs)),
+            "content": self.content.raw(pred) if self.content else None,
+            "cached": hit,
+        }
+
+    def health(self) -> dict:
+        return {
+            "status": "ok", "backend": self.predictor.name, "model_id": self.model_id,
+            "batcher": self.batcher.stats() if self.batcher else None,
+            "cache": self.cache.stats(), "startup": self.startup.timings,
+        }
+
+
+def make_handler(service: PredictService):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _json(self, code: int, obj, headers: dict | None = None):
+            body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            for k, v in (headers or {}).items(): self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/health":
+                return self._json(200, service.health())
+            if self.path == "/metrics":
+                body = REGISTRY.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                return self.wfile.write(body)
+            if self.path == "/labels":
+                return self._json(200, {"labels": service.labels, "input_size": service.startup.input_size,
+                                        "model_id": service.model_id})
+            self._json(404, {"error": "not found"})
+
+        def do_POST(self):
+            if self.path != "/predict":
+                return self._json(404, {"error": "not found"})
+            t0, code = time.perf_counter(), 200
+            try:
+                try:
+                    n = int(self.headers.get("Content-Length", 0))
+                except ValueError:
+                    n = -1
+                if n < 0:
+                    code = 400
+                    return self._json(code, {"error": "잘못된 Content-Length"})
+                # base64 JSON은 원본보다 약 4/3 크므로 그만큼 허용. 본문을 읽기 전에 거절
+                is_json = self.headers.get("Content-Type", "").startswith("application/json")
+                if n > (MAX_BYTES * 4 // 3 + 1024 if is_json else MAX_BYTES):
+                    code = 413
+                    self.close_connection = True
+                    return self._json(code, {"error": f"본문이 너무 큽니다 ({n} bytes)"})
+                b = self.rfile.read(n)
+                if is_json:
+                    try:
+                        b = base64.b64decode(json.loads(b)["image_b64"])
+                    except Exception:
+                        code = 400
+                        return self._json(code, {"error": "JSON 본문에 image_b64가 필요합니다"})
+                self._json(200, service.predict_bytes(b))
+            except IngestError as e:
+                code = 400
+                self._json(code, {"error": str(e)})
+            except QueueFull as e:
+                code = 503
+                self._json(code, {"error": str(e)}, {"Retry-After": "1"})
+            except TimeoutError:
+                code = 504
+                self._json(code, {"error": "예측 시간 초과"})
+            except Exception as e:
+                # 예측기 오류(배처 Future 포함), 디코딩 중 예외 등: 연결을 끊지 말고 500으로 응답
+                code = 500
+                self.log_error("predict 실패: %r", e)
+                self._json(code, {"error": f"{type(e).__name__}: {e}"})
+            finally:
+                REGISTRY.observe("request_seconds", time.perf_counter() - t0, code=code)
+
+        def log_request(self, code="-", size="-"):
+            pass  # 요청마다 stderr 로그를 남기지 않음 (오류는 log_error로 남김)
+
+    return Handler
+
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="이미지 분류 예측 API 서버")
+    ap.add_argument("--host", default="0.0.0.0")
+    ap.add_argument("--port", type=int, default=8000)
+    ap.add_argument("--file-id", default=os.environ.get("GDRIVE_FILE_ID", DEFAULT_FILE_ID))
+    ap.add_argument("--model-path", default=os.environ.get("MODEL_PATH", "model.pkl"))
+    ap.add_argument("--sha256", default=os.environ.get("MODEL_SHA256"))
+    ap.add_argument("--mode", default=os.environ.get("PREDICTOR_MODE", "lean"))
+    ap.add_argument("--threads", type=int, default=None)
+    ap.add_argument("--content", default="content/labels.json")
+    ap.add_argument("--cache-max", type=int, default=256)
+    ap.add_argument("--no-batch", action="store_true", help="동적 배처 끄기 (요청마다 개별 forward)")
+    ap.add_argument("--max-batch", type=int, default=16)
+    ap.add_argument("--max-wait-ms", type=float, default=5.0)
+    ap.add_argument("--max-queue", type=int, default=256)
+    ap.add_argument("--timeout", type=float, default=30.0)
+    return ap.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    service = PredictService(args)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(service))
+    server.daemon_threads = True
+    print(f"예측 서버: http://{args.host}:{args.port} (backend={service.predictor.name}, "
+          f"batcher={'off' if args.no_batch else 'on'})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if service.batcher: service.batcher.close()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# batch_classify.py
+# 여러 장(다중 업로드/ZIP)을 스레드 풀로 디코딩하고 고정 크기 배치로 한 번에 추론
+import os, zipfile
+from io import BytesIO
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+
+from ingest import MAX_BYTES
+
+IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".webp", ".tiff", ".tif")
+
+
+def _zip_members(zf: zipfile.ZipFile):
+    for info in zf.infolist():
+        inner = info.filename
+        if info.is_dir() or "__MACOSX" in inner or not inner.lower().endswith(IMAGE_EXTS): continue
+        yield info
+
+
+def count_upload_items(files, max_files: int = 5000) -> int:
+    """진행률 표시용 전체 개수. ZIP은 목록(infolist)만 읽고 압축은 풀지 않는다."""
+    n = 0
+    for f in files:
+        if f.name.lower().endswith(".zip"):
+            try:
+                with zipfile.ZipFile(BytesIO(f.getvalue())) as zf:
+                    n += sum(1 for _ in _zip_members(zf))
+            except zipfile.BadZipFile:
+                n += 1  # iter_upload_items가 오류 행 하나로 보고
+        else:
+            n += 1
+    return min(n, max_files)
+
+
+def iter_upload_items(files, max_files: int = 5000, max_bytes: int = MAX_BYTES):
+    """업로드 파일들 -> (이름, 바이트 또는 None, 오류 메시지 또는 None). ZIP은 안의 이미지 파일로 펼친다.
+
+    필요할 때 하나씩 압축을 풀고, 헤더의 file_size가 max_bytes를 넘는 항목(ZIP 폭탄 등)은 풀지 않고 오류로 보고한다.
+    ZipExtFile은 file_size 이상 출력하지 않으므로 헤더 검사만으로 상한이 지켜진다.
+    """
+    n = 0
+    for f in files:
+        name, data = f.name, f.getvalue()
+        if name.lower().endswith(".zip"):
+            try:
+                zf = zipfile.ZipFile(BytesIO(data))
+            except zipfile.BadZipFile as e:
+                if n >= max_files: return
+                yield name, None, f"BadZipFile: {e}"
+                n += 1
+                continue
+            with zf:
+                for info in _zip_members(zf):
+                    if n >= max_files: return
+                    n += 1
+                    full = f"{name}/{info.filename}"
+                    if info.file_size > max_bytes:
+                        yield full, None, f"파일이 너무 큽니다 ({info.file_size / 2**20:.1f} MB > {max_bytes / 2**20:.0f} MB)"
+                        continue
+                    try:
+                        yield full, zf.read(info), None
+                    except Exception as e:
+                        yield full, None, f"{type(e).__name__}: {e}"
+        else:
+            if n >= max_files: return
+            yield name, data, None
+            n += 1
+
+
+def _safe_decode(decode, b: bytes):
+    try:
+        return decode(b), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def _predict_each(predictor, imgs):
+    """배치 추론이 실패하면 한 장씩 다시 추론: 실패한 항목만 (None, 오류 메시지)."""
+    out = []
+    for img in imgs:
+        try:
+            out.append((predictor.predict(img), None))
+        except Exception as e:
+            out.append((None, f"{type(e).__name__}: {e}"))
+    return out
+
+
+def classify_stream(predictor, items, decode, batch_size: int = 32, workers: int | None = None):
+    """(이름, 바이트, 오류) 항목을 batch_size씩 추론하며 배치마다 결과 행 목록을 yield.
+
+    items는 지연 이터레이터여도 되며, 한 번에 현재 배치와 미리 읽는 다음 배치만 메모리에 둔다.
+    현재 배치를 추론하는 동안 다음 배치를 스레드 풀에서 미리 디코딩한다.
+    배치 추론이 예외를 내면(예: 원격 서버가 한 장을 400으로 거절) 그 배치만 한 장씩 다시 돌려 오류 행으로 남긴다.
+    행: {"file", "label", "error", <라벨별 확률>...}
+    """
+    it = iter(items)
+    labels = predictor.vocab
+    workers = workers or min(8, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        def submit():
+            chunk = list(islice(it, batch_size))
+            futs = [pool.submit(_safe_decode, decode, b) if err is None else None for _, b, err in chunk]
+            return chunk, futs
+
+        chunk, futs = submit()
+        while chunk:
+            nxt = submit()
+            decoded = [f.result() if f is not None else (None, err) for f, (_, _, err) in zip(futs, chunk)]
+            ok = [img for img, err in decoded if err is None]
+            try:
+                preds = iter([(r, None) for r in predictor.predict_batch(ok)])
+            except Exception:
+                preds = iter(_predict_each(predictor, ok))
+            rows = []
+            for (name, _, _), (img, err) in zip(chunk, decoded):
+                if err is None:
+                    res, err = next(preds)
+                row = {"file": name, "label": "", "error": err or ""}
+                if err is None:
+                    pred, _, probs = res
+                    row["label"] = pred
+                    row.update({lbl: float(p) for lbl, p in zip(labels, probs)})
+                rows.append(row)
+            yield rows
+            chunk, futs = nxt
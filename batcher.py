@@ -0,0 +1,92 @@
+# batcher.py
+# 동시에 들어온 요청을 모아 한 번의 forward로 처리하는 동적 배처
+import time, queue, threading
+from concurrent.futures import Future
+
+
+class QueueFull(RuntimeError):
+    """대기열이 가득 참 (backpressure). 호출 측은 503 등으로 거절."""
+
+
+class DynamicBatcher:
+    """submit(item) -> Future. 워커 스레드가 최대 max_batch개 또는 max_wait_ms까지 모아 fn(items) 한 번 호출.
+
+    fn은 items와 같은 길이의 결과 리스트를 반환해야 한다 (다르면 그 배치 전체가 예외로 끝난다).
+    close() 후에는 submit이 거절되고, 대기열에 남은 요청도 예외로 끝나 호출 측이 timeout까지 기다리지 않는다.
+    """
+
+    def __init__(self, fn, max_batch: int = 16, max_wait_ms: float = 5.0, max_queue: int = 256):
+        self.fn = fn
+        self.max_batch, self.max_wait = max_batch, max_wait_ms / 1000
+        self._q: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self.batches = self.items = self.rejected = 0
+        self._thread = threading.Thread(target=self._loop, name="dynamic-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, item) -> Future:
+        fut = Future()
+        with self._lock:  # close()의 종료 표시와 순서를 맞춰, 종료 후 넣은 요청이 방치되지 않게
+            if self._stop.is_set():
+                raise RuntimeError("배처가 종료되었습니다")
+            try:
+                self._q.put_nowait((item, fut))
+            except queue.Full:
+                self.rejected += 1
+                raise QueueFull(f"대기열 가득 참 ({self._q.maxsize})") from None
+        return fut
+
+    def _collect(self):
+        try:
+            batch = [self._q.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0: break
+            try:
+                batch.append(self._q.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _loop(self):
+        while not self._stop.is_set():
+            batch = self._collect()
+            if not batch: continue
+            batch = [(x, f) for x, f in batch if f.set_running_or_notify_cancel()]
+            if not batch: continue
+            try:
+                results = list(self.fn([x for x, _ in batch]))
+                if len(results) != len(batch):
+                    raise RuntimeError(f"배치 결과 수 불일치: 입력 {len(batch)}개, 결과 {len(results)}개")
+            except Exception as e:
+                for _, f in batch: f.set_exception(e)
+            else:
+                for (_, f), r in zip(batch, results): f.set_result(r)
+            with self._lock:
+                self.batches += 1
+                self.items += len(batch)
+
+    def close(self):
+        with self._lock:
+            self._stop.set()
+        self._thread.join(timeout=1.0)
+        # 워커가 가져가지 못한 요청은 즉시 실패 처리
+        while True:
+            try:
+                _, f = self._q.get_nowait()
+            except queue.Empty:
+                break
+            if f.set_running_or_notify_cancel(): f.set_exception(RuntimeError("배처가 종료되었습니다"))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "queue": self._q.qsize(), "max_queue": self._q.maxsize,
+                "max_batch": self.max_batch, "max_wait_ms": self.max_wait * 1000,
+                "batches": self.batches, "items": self.items, "rejected": self.rejected,
+                "mean_batch": (self.items / self.batches) if self.batches else 0.0,
+            }
@@ -0,0 +1,52 @@
+# bench_backends.py
+# 예측 백엔드별 p50/p95 지연시간·처리량 + fastai 경로와의 일치 확인
+#   python benchmarks/bench_backends.py --model model.pkl [--backends lean,torchscript,onnx,int8] [--threads 4]
+import os, sys, json, argparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastai.vision.all import load_learner
+
+from inference import make_predictor, check_parity, measure_latency
+from bench_lean_predict import load_images
+
+# int8 양자화는 확률이 조금 달라지므로 허용 오차를 크게 둔다 (라벨은 반드시 일치)
+ATOL = {"int8": 5e-2}
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--model", default="model.pkl")
+    ap.add_argument("--images", default=None)
+    ap.add_argument("--backends", default="fastai,lean,torchscript,onnx,int8")
+    ap.add_argument("--threads", type=int, default=None)
+    ap.add_argument("--batch-size", type=int, default=1)
+    ap.add_argument("-n", type=int, default=50)
+    ap.add_argument("--atol", type=float, default=1e-4)
+    ap.add_argument("--json", default=None, help="결과를 저장할 JSON 경로")
+    args = ap.parse_args()
+
+    learner = load_learner(args.model, cpu=True)
+    imgs = load_images(args.images)
+    print(f"라벨: {', '.join(str(x) for x in learner.dls.vocab)}")
+
+    results = []
+    for mode in args.backends.split(","):
+        try:
+            pred = make_predictor(learner, mode, model_path=args.model, threads=args.threads)
+        except ImportError as e:
+            print(f"{mode:>12}: 건너뜀 ({e})")
+            continue
+        r = measure_latency(pred, imgs, n=args.n, batch_size=args.batch_size)
+        if mode != "fastai":
+            r["max_diff"] = check_parity(learner, imgs, atol=ATOL.get(mode, args.atol), predictor=pred)
+        results.append(r)
+        diff = f" · max|diff| {r['max_diff']:.1e}" if "max_diff" in r else ""
+        print(f"{mode:>12}: p50 {r['p50_ms']:.1f} ms · p95 {r['p95_ms']:.1f} ms · {r['throughput']:.1f} img/s{diff}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
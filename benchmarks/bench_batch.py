@@ -0,0 +1,37 @@
+# bench_batch.py
+# 일괄 분류 처리량(장/초)을 배치 크기 × torch 스레드 수별로 측정
+#   python benchmarks/bench_batch.py --model model.pkl [--mode lean] [--batch-sizes 1,8,32] [--threads 1,2,4]
+import os, sys, argparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import torch
+from fastai.vision.all import load_learner
+
+from inference import make_predictor, measure_latency
+from bench_lean_predict import load_images
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--model", default="model.pkl")
+    ap.add_argument("--images", default=None)
+    ap.add_argument("--mode", default="lean")
+    ap.add_argument("--batch-sizes", default="1,4,8,16,32")
+    ap.add_argument("--threads", default=str(os.cpu_count() or 1))
+    ap.add_argument("-n", type=int, default=10, help="측정할 배치 수")
+    args = ap.parse_args()
+
+    learner = load_learner(args.model, cpu=True)
+    pred = make_predictor(learner, args.mode, model_path=args.model)
+    imgs = load_images(args.images)
+
+    print(f"{'threads':>7} {'batch':>5} {'p50 ms':>9} {'img/s':>8}")
+    for th in (int(x) for x in args.threads.split(",")):
+        torch.set_num_threads(th)
+        for bs in (int(x) for x in args.batch_sizes.split(",")):
+            r = measure_latency(pred, imgs, n=args.n, batch_size=bs, warmup=1)
+            print(f"{th:>7} {bs:>5} {r['p50_ms']:>9.1f} {r['throughput']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# bench_ingest.py
+# 입력 해상도별 디코딩 시간과 최대 RSS: 기존 경로(전체 디코딩 + np.array 복사) vs ingest_image
+#   python benchmarks/bench_ingest.py [--sizes 1,4,12,24] [--min-side 224]
+import os, sys, time, argparse, resource, subprocess, json
+from io import BytesIO
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+from PIL import Image, ImageOps
+
+
+def make_jpeg(mp: float, quality: int = 90) -> bytes:
+    """4:3 비율, 약 mp 메가픽셀의 노이즈+그라디언트 JPEG."""
+    h = int((mp * 1e6 * 3 / 4) ** 0.5); w = int(h * 4 / 3)
+    rng = np.random.default_rng(0)
+    a = (np.linspace(0, 255, w, dtype=np.float32)[None, :, None] + rng.normal(0, 20, (h, 1, 3))).clip(0, 255)
+    a = np.broadcast_to(a, (h, w, 3)).astype(np.uint8)
+    buf = BytesIO(); Image.fromarray(a).save(buf, "JPEG", quality=quality)
+    return buf.getvalue()
+
+
+def legacy(b: bytes, min_side: int):
+    pil = Image.open(BytesIO(b))
+    pil = ImageOps.exif_transpose(pil)
+    if pil.mode != "RGB": pil = pil.convert("RGB")
+    return np.array(pil).copy()  # np.array + PILImage.create 복사
+
+
+def ingest(b: bytes, min_side: int):
+    from ingest import ingest_image
+    return ingest_image(b, min_side=min_side)
+
+
+def child(path: str, fn: str, min_side: int, reps: int):
+    """별도 프로세스에서 실행해 최대 RSS를 격리 측정."""
+    b = open(path, "rb").read()
+    base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    f = {"legacy": legacy, "ingest": ingest}[fn]
+    ts = []
+    for _ in range(reps):
+        t0 = time.perf_counter(); f(b, min_side); ts.append(time.perf_counter() - t0)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"ms": sorted(ts)[len(ts) // 2] * 1000, "rss_mb": peak / 1024, "delta_mb": (peak - base) / 1024}))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", default="1,4,12,24", help="메가픽셀 목록")
+    ap.add_argument("--min-side", type=int, default=224)
+    ap.add_argument("--reps", type=int, default=5)
+    ap.add_argument("--_child", nargs=2, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args._child:
+        return child(args._child[0], args._child[1], args.min_side, args.reps)
+
+    import tempfile
+    print(f"{'MP':>5} {'path':>7} {'decode ms':>10} {'peak RSS MB':>12} {'+RSS MB':>8}")
+    for mp in (float(x) for x in args.sizes.split(",")):
+        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as f:
+            f.write(make_jpeg(mp)); path = f.name
+        try:
+            for fn in ("legacy", "ingest"):
+                out = subprocess.run([sys.executable, __file__, "--_child", path, fn, "--min-side", str(args.min_side),
+                                      "--reps", str(args.reps)], capture_output=True, text=True, check=True)
+                r = json.loads(out.stdout)
+                print(f"{mp:>5g} {fn:>7} {r['ms']:>10.1f} {r['rss_mb']:>12.1f} {r['delta_mb']:>8.1f}")
+        finally:
+            os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
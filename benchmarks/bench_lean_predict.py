@@ -0,0 +1,73 @@
+# bench_lean_predict.py
+# learner.predict vs LeanPredictor 단일 이미지 지연시간 비교 + 확률 일치 확인
+#   python benchmarks/bench_lean_predict.py --model model.pkl [--images 폴더] [-n 50]
+#   python benchmarks/bench_lean_predict.py --rrc-check     # RandomResizedCrop 합성 learner로 대체 경로 일치 확인
+import os, sys, time, argparse, statistics
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from PIL import Image
+from fastai.vision.all import load_learner
+
+from inference import FastaiPredictor, LeanPredictor, check_parity
+
+
+def load_images(folder: str | None, k: int = 8):
+    if folder:
+        exts = (".jpg", ".jpeg", ".png", ".webp", ".tiff")
+        files = sorted(f for f in os.listdir(folder) if f.lower().endswith(exts))[:k]
+        return [Image.open(os.path.join(folder, f)).convert("RGB") for f in files]
+    rng = np.random.default_rng(0)
+    sizes = [(640, 480), (480, 640), (1024, 768), (300, 300)]
+    return [Image.fromarray(rng.integers(0, 256, (h, w, 3), dtype=np.uint8)) for w, h in sizes]
+
+
+def bench(pred, imgs, n: int, warmup: int = 3):
+    for i in range(warmup): pred.predict(imgs[i % len(imgs)])
+    ts = []
+    for i in range(n):
+        t0 = time.perf_counter()
+        pred.predict(imgs[i % len(imgs)])
+        ts.append((time.perf_counter() - t0) * 1000)
+    ts.sort()
+    return {"p50": statistics.median(ts), "p95": ts[int(0.95 * (len(ts) - 1))], "mean": statistics.fmean(ts)}
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--model", default="model.pkl")
+    ap.add_argument("--images", default=None, help="테스트 이미지 폴더 (없으면 랜덤 이미지)")
+    ap.add_argument("-n", type=int, default=50)
+    ap.add_argument("--atol", type=float, default=1e-4)
+    ap.add_argument("--rrc-check", action="store_true",
+                    help="RandomResizedCrop item_tfms 합성 learner로 fastai 대체(fallback) 경로 일치도 확인")
+    args = ap.parse_args()
+
+    if args.rrc_check:
+        import tempfile
+        from fastai.vision.all import RandomResizedCrop
+        from suite import build_synthetic_model
+        with tempfile.TemporaryDirectory() as d:
+            path = build_synthetic_model(["a", "b", "c"], os.path.join(d, "rrc.pkl"),
+                                         item_tfms=RandomResizedCrop(192, min_scale=0.5))
+            rrc = load_learner(path, cpu=True)
+        imgs = load_images(args.images)
+        # 두 번 돌려 무작위 crop이 섞이지 않았는지(결정적인지)도 확인
+        diff = max(check_parity(rrc, imgs, atol=args.atol), check_parity(rrc, imgs, atol=args.atol))
+        print(f"RandomResizedCrop 확률 일치: max|diff| = {diff:.2e} (허용 {args.atol:.0e})")
+
+    learner = load_learner(args.model, cpu=True)
+    imgs = load_images(args.images)
+
+    diff = check_parity(learner, imgs, atol=args.atol)
+    print(f"확률 일치: max|diff| = {diff:.2e} (허용 {args.atol:.0e})")
+
+    res = {}
+    for p in (FastaiPredictor(learner), LeanPredictor(learner)):
+        res[p.name] = r = bench(p, imgs, args.n)
+        print(f"{p.name:>8}: p50 {r['p50']:.1f} ms · p95 {r['p95']:.1f} ms · mean {r['mean']:.1f} ms")
+    print(f"속도 향상 (p50): x{res['fastai']['p50'] / res['lean']['p50']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# load_test.py
+# 예측 API 부하 테스트: 동시 클라이언트 수별 처리량과 p50/p95/p99 지연시간
+#   python benchmarks/load_test.py --url http://localhost:8000 -c 16 -d 20
+#   python benchmarks/load_test.py --spawn --model-path model.pkl   # 서버를 배처 on/off로 직접 띄워 비교
+import os, sys, time, json, struct, argparse, itertools, threading, subprocess, urllib.request, urllib.error
+from io import BytesIO
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from PIL import Image
+
+
+def make_payloads(k: int = 64, size=(640, 480)) -> list[bytes]:
+    """서로 다른 JPEG k장. 요청마다 unique()로 바이트를 바꿔 보내므로 서버 예측 캐시에 걸리지 않는다."""
+    rng = np.random.default_rng(0)
+    out = []
+    for _ in range(k):
+        buf = BytesIO()
+        Image.fromarray(rng.integers(0, 256, (size[1], size[0], 3), dtype=np.uint8)).save(buf, "JPEG", quality=85)
+        out.append(buf.getvalue())
+    return out
+
+
+def unique(jpeg: bytes, n: int) -> bytes:
+    """SOI 바로 뒤에 요청 번호를 담은 JPEG 주석(COM) 세그먼트 삽입: 디코딩 결과는 같고 캐시 키만 달라진다."""
+    body = f"load-test {n}".encode()
+    return jpeg[:2] + b"\xff\xfe" + struct.pack(">H", len(body) + 2) + body + jpeg[2:]
+
+
+def run_load(url: str, payloads, concurrency: int, duration: float) -> dict:
+    lat, errors, rejected = [], 0, 0
+    lock = threading.Lock()
+    stop = time.perf_counter() + duration
+    seq = itertools.count()  # 모든 스레드에서 요청 번호가 겹치지 않도록 (next()는 GIL 아래 원자적)
+
+    def worker(i: int):
+        nonlocal errors, rejected
+        j = i
+        while time.perf_counter() < stop:
+            req = urllib.request.Request(url + "/predict", data=unique(payloads[j % len(payloads)], next(seq)), method="POST",
+                                         headers={"Content-Type": "application/octet-stream"})
+            j += concurrency
+            t0 = time.perf_counter()
+            try:
+                with urllib.request.urlopen(req, timeout=60) as r: r.read()
+                with lock: lat.append(time.perf_counter() - t0)
+            except urllib.error.HTTPError as e:
+                with lock:
+                    if e.code == 503: rejected += 1
+                    else: errors += 1
+            except Exception:
+                with lock: errors += 1
+
+    t0 = time.perf_counter()
+    ths = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    for t in ths: t.start()
+    for t in ths: t.join()
+    elapsed = time.perf_counter() - t0
+    lat.sort()
+    q = lambda p: lat[min(len(lat) - 1, int(p * len(lat)))] * 1000 if lat else float("nan")
+    return {"concurrency": concurrency, "requests": len(lat), "errors": errors, "rejected": rejected,
+            "throughput": len(lat) / elapsed, "p50_ms": q(0.50), "p95_ms": q(0.95), "p99_ms": q(0.99)}
+
+
+def wait_ready(url: str, timeout: float = 600):
+    end = time.time() + timeout
+    while time.time() < end:
+        try:
+            with urllib.request.urlopen(url + "/health", timeout=2): return
+        except Exception:
+            time.sleep(0.5)
+    raise TimeoutError(f"서버 응답 없음: {url}")
+
+
+def print_row(tag: str, r: dict):
+    print(f"{tag:>9} {r['concurrency']:>4} {r['throughput']:>8.1f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} "
+          f"{r['p99_ms']:>8.1f} {r['rejected']:>6} {r['errors']:>5}")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--url", default="http://localhost:8000")
+    ap.add_argument("-c", "--concurrency", default="1,4,16,32")
+    ap.add_argument("-d", "--duration", type=float, default=15.0)
+    ap.add_argument("--spawn", action="store_true", help="api_server.py를 배처 on/off로 띄워 둘 다 측정")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--model-path", default="model.pkl")
+    ap.add_argument("--mode", default="lean")
+    ap.add_argument("--json", default=None)
+    args = ap.parse_args()
+
+    payloads = make_payloads()
+    levels = [int(x) for x in args.concurrency.split(",")]
+    print(f"{'batcher':>9} {'conc':>4} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'503':>6} {'err':>5}")
+    results = []
+    if not args.spawn:
+        for c in levels:
+            r = run_load(args.url, payloads, c, args.duration); print_row("-", r); results.append(r)
+    else:
+        url = f"http://127.0.0.1:{args.port}"
+        for tag, extra in (("on", []), ("off", ["--no-batch"])):
+            cmd = [sys.executable, os.path.join(ROOT, "api_server.py"), "--host", "127.0.0.1", "--port", str(args.port),
+                   "--model-path", args.model_path, "--mode", args.mode, "--cache-max", "0", *extra]
+            proc = subprocess.Popen(cmd, cwd=ROOT, stdout=subprocess.DEVNULL)
+            try:
+                wait_ready(url)
+                for c in levels:
+                    r = run_load(url, payloads, c, args.duration)
+                    r["batcher"] = tag
+                    print_row(tag, r); results.append(r)
+            finally:
+                proc.terminate(); proc.wait()
+    if args.json:
+        with open(args.json, "w") as f: json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
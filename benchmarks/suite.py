@@ -0,0 +1,272 @@
+# suite.py
+# 오프라인 재현 가능한 분류기 파이프라인 벤치마크 모음. 결과는 JSON, 기준선과 비교해 회귀 표시
+#   python benchmarks/suite.py --out bench.json                       # 합성 모델(같은 vocab)로 실행
+#   python benchmarks/suite.py --vocab dynamax,mega,terastal --out bench.json
+#   python benchmarks/suite.py --model model.pkl --out new.json --baseline bench.json --threshold 0.1
+#   python benchmarks/suite.py --only decode,predict                  # 일부만
+#
+# 측정 항목
+#   decode   업로더 허용 형식(jpg/png/webp/tiff) × 해상도별 ingest_image 시간
+#   predict  learner.predict(fastai) / 앱 예측기 단일 이미지 지연시간
+#   batch    torch 스레드 수 × 배치 크기별 처리량
+#   apptest  Streamlit AppTest로 스크립트 rerun 비용 (첫 실행 / 재실행 / 라벨 선택 변경)
+import os, sys, json, time, base64, random, shutil, argparse, platform, tempfile, statistics
+from io import BytesIO
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+from PIL import Image
+
+SEED = 0
+FORMATS = {"jpg": "JPEG", "png": "PNG", "webp": "WEBP", "tiff": "TIFF"}
+
+
+def seed_all(seed: int = SEED):
+    import torch
+    random.seed(seed); np.random.seed(seed); torch.manual_seed(seed)
+
+
+# ----------------------
+# 합성 모델 (Drive 다운로드 대신)
+# ----------------------
+def build_synthetic_model(vocab: list[str], out_path: str, arch: str = "resnet18", size: int = 224,
+                          item_tfms=None) -> str:
+    """같은 vocab의 학습 안 된 vision_learner를 만들어 export. 네트워크 불필요(pretrained=False).
+
+    item_tfms 기본값은 Resize(size). fastbook식 RandomResizedCrop 등을 넘겨 다른 전처리도 시험할 수 있다.
+    """
+    from pathlib import Path
+    from fastai.vision.all import (DataBlock, ImageBlock, CategoryBlock, Resize, Normalize, RandomSplitter,
+                                   get_image_files, parent_label, vision_learner, imagenet_stats)
+    import torchvision.models as tvm
+    seed_all()
+    rng = np.random.default_rng(SEED)
+    with tempfile.TemporaryDirectory() as d:
+        for lbl in vocab:
+            os.makedirs(os.path.join(d, lbl))
+            for i in range(4):
+                a = rng.integers(0, 256, (size, size, 3), dtype=np.uint8)
+                Image.fromarray(a).save(os.path.join(d, lbl, f"{i}.png"))
+        dls = DataBlock(
+            blocks=(ImageBlock, CategoryBlock), get_items=get_image_files, get_y=parent_label,
+            splitter=RandomSplitter(0.25, seed=SEED), item_tfms=item_tfms or Resize(size),
+            batch_tfms=Normalize.from_stats(*imagenet_stats),
+        ).dataloaders(d, bs=4, num_workers=0)
+        learn = vision_learner(dls, getattr(tvm, arch), pretrained=False)
+        learn.path = Path(os.path.dirname(os.path.abspath(out_path)))
+        learn.export(os.path.basename(out_path))
+    return out_path
+
+
+def encode(a: np.ndarray, fmt: str) -> bytes:
+    buf = BytesIO()
+    kw = {"quality": 90} if fmt in ("JPEG", "WEBP") else {}
+    Image.fromarray(a).save(buf, fmt, **kw)
+    return buf.getvalue()
+
+
+def photo_like(w: int, h: int) -> np.ndarray:
+    """그라디언트 + 노이즈 (순수 노이즈보다 실제 사진에 가까운 압축률)."""
+    rng = np.random.default_rng(SEED)
+    x = np.linspace(0, 255, w, dtype=np.float32)[None, :, None]
+    y = np.linspace(0, 255, h, dtype=np.float32)[:, None, None]
+    a = (0.5 * x + 0.5 * y + rng.normal(0, 12, (h, w, 3))).clip(0, 255)
+    return a.astype(np.uint8)
+
+
+def timeit(fn, reps: int, warmup: int = 1) -> list[float]:
+    for _ in range(warmup): fn()
+    ts = []
+    for _ in range(reps):
+        t0 = time.perf_counter(); fn(); ts.append(time.perf_counter() - t0)
+    return ts
+
+
+def metric(value: float, unit: str, better: str = "lower") -> dict:
+    return {"value": round(float(value), 4), "unit": unit, "better": better}
+
+
+# ----------------------
+# 벤치마크
+# ----------------------
+def bench_decode(res: dict, min_side: int, sizes_mp, reps: int):
+    from ingest import ingest_image
+    for mp in sizes_mp:
+        h = int((mp * 1e6 * 3 / 4) ** 0.5); w = int(h * 4 / 3)
+        a = photo_like(w, h)
+        for ext, fmt in FORMATS.items():
+            b = encode(a, fmt)
+            ts = timeit(lambda: ingest_image(b, min_side=min_side), reps)
+            res[f"decode.{ext}.{mp:g}mp.ms"] = metric(statistics.median(ts) * 1000, "ms")
+
+
+def bench_predict(res: dict, learner, model_path: str, mode: str, imgs, n: int):
+    from inference import make_predictor, measure_latency
+    modes = ["fastai"] + ([mode] if mode != "fastai" else [])
+    for m in modes:
+        r = measure_latency(make_predictor(learner, m, model_path=model_path), imgs, n=n)
+        res[f"predict.{m}.p50_ms"] = metric(r["p50_ms"], "ms")
+        res[f"predict.{m}.p95_ms"] = metric(r["p95_ms"], "ms")
+
+
+def bench_batch(res: dict, learner, model_path: str, mode: str, imgs, threads, batch_sizes, n: int):
+    import torch
+    from inference import make_predictor, measure_latency
+    pred = make_predictor(learner, mode, model_path=model_path)
+    orig = torch.get_num_threads()
+    try:
+        for th in threads:
+            torch.set_num_threads(th)
+            for bs in batch_sizes:
+                r = measure_latency(pred, imgs, n=n, batch_size=bs, warmup=1)
+                res[f"batch.{mode}.t{th}.b{bs}.img_s"] = metric(r["throughput"], "img/s", "higher")
+    finally:
+        torch.set_num_threads(orig)
+
+
+def write_local_manifest(work: str, vocab: list[str]) -> str:
+    """네트워크 없는 라벨 콘텐츠: 라벨마다 텍스트 + 로컬 이미지(data URI) 하나. 원격 URL/유튜브 없음."""
+    buf = BytesIO()
+    Image.fromarray(photo_like(320, 240)).save(buf, "JPEG", quality=85)
+    uri = "data:image/jpeg;base64," + base64.b64encode(buf.getvalue()).decode()
+    manifest = {lbl: {"texts": [f"{lbl} 설명"], "images": [uri], "videos": []} for lbl in vocab}
+    path = os.path.join(work, "labels.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    return path
+
+
+def bench_apptest(res: dict, model_path: str, mode: str, image_bytes: bytes, reruns: int, work: str, vocab):
+    """스크립트 전체 rerun 비용. 업로드 위젯 대신 세션 상태에 이미지를 넣어 둔다.
+
+    라벨 콘텐츠는 work 안의 로컬 매니페스트/썸네일 캐시를 써서 네트워크와 저장소(static/)를 건드리지 않는다.
+    """
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(os.path.join(ROOT, "streamlit_app.py"), default_timeout=600)
+    at.secrets["MODEL_PATH"] = model_path
+    at.secrets["PREDICTOR_MODE"] = mode
+    at.secrets["CONTENT_MANIFEST"] = write_local_manifest(work, vocab)
+    at.secrets["THUMB_CACHE_DIR"] = os.path.join(work, "thumbs")
+    at.session_state["img_bytes"] = image_bytes
+    t0 = time.perf_counter(); at.run()
+    res["apptest.first_run_s"] = metric(time.perf_counter() - t0, "s")
+    if at.exception:
+        raise RuntimeError(f"AppTest 실패: {at.exception[0].message}")
+    ts = timeit(lambda: at.run(), reruns, warmup=0)
+    res["apptest.rerun_ms"] = metric(statistics.median(ts) * 1000, "ms")
+    sb = next(s for s in at.selectbox if s.label == "표시할 라벨 선택")
+    opts = list(sb.options)
+    ts = []
+    for i in range(reruns):
+        t0 = time.perf_counter(); sb.set_value(opts[i % len(opts)]).run(); ts.append(time.perf_counter() - t0)
+        sb = next(s for s in at.selectbox if s.label == "표시할 라벨 선택")
+    res["apptest.label_switch_ms"] = metric(statistics.median(ts) * 1000, "ms")
+
+
+# ----------------------
+# 기준선 비교
+# ----------------------
+def compare(new: dict, base: dict, threshold: float) -> list[str]:
+    """회귀한 지표 이름 목록. lower는 증가, higher는 감소가 threshold 비율을 넘으면 회귀."""
+    regressions = []
+    print(f"\n{'지표':<36} {'기준':>10} {'현재':>10} {'변화':>8}")
+    for name, m in sorted(new["metrics"].items()):
+        b = base.get("metrics", {}).get(name)
+        if b is None or not b["value"]:
+            print(f"{name:<36} {'-':>10} {m['value']:>10.3f}"); continue
+        change = (m["value"] - b["value"]) / b["value"]
+        bad = change > threshold if m["better"] == "lower" else change < -threshold
+        if bad: regressions.append(name)
+        print(f"{name:<36} {b['value']:>10.3f} {m['value']:>10.3f} {change * 100:>+7.1f}%{'  ← 회귀' if bad else ''}")
+    return regressions
+
+
+def environment(model_path: str, synthetic: bool) -> dict:
+    import torch, PIL
+    env = {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count(),
+           "torch": torch.__version__, "pillow": PIL.__version__, "torch_threads": torch.get_num_threads(),
+           "synthetic_model": synthetic, "seed": SEED}
+    try:
+        import fastai; env["fastai"] = fastai.__version__
+    except ImportError:
+        pass
+    try:
+        import streamlit; env["streamlit"] = streamlit.__version__
+    except ImportError:
+        pass
+    from pred_cache import model_identity
+    env["model"] = model_identity(model_path)
+    return env
+
+
+def main():
+    ap = argparse.ArgumentParser(description="분류기 파이프라인 오프라인 벤치마크")
+    ap.add_argument("--model", default=None, help="기존 model.pkl (없으면 합성 모델 생성)")
+    ap.add_argument("--vocab", default="label0,label1,label2", help="합성 모델 라벨 (쉼표 구분)")
+    ap.add_argument("--arch", default="resnet18")
+    ap.add_argument("--mode", default="lean", help="앱 예측기 모드 (lean/torchscript/onnx/int8/fastai)")
+    ap.add_argument("--only", default="decode,predict,batch,apptest")
+    ap.add_argument("--sizes", default="0.3,2,12", help="decode 해상도 (메가픽셀)")
+    ap.add_argument("--threads", default=None, help="batch 스레드 수 목록 (기본: 1,코어 수)")
+    ap.add_argument("--batch-sizes", default="1,8,32")
+    ap.add_argument("-n", type=int, default=30)
+    ap.add_argument("--reruns", type=int, default=5)
+    ap.add_argument("--out", default=None, help="결과 JSON 경로")
+    ap.add_argument("--baseline", default=None, help="비교할 기준 JSON")
+    ap.add_argument("--threshold", type=float, default=0.10, help="회귀 판정 비율 (0.1 = 10%%)")
+    args = ap.parse_args()
+
+    # 상대 경로는 호출한 위치 기준으로 고정한 뒤 저장소 루트로 이동
+    args.out = args.out and os.path.abspath(args.out)
+    args.baseline = args.baseline and os.path.abspath(args.baseline)
+    args.model = args.model and os.path.abspath(args.model)
+    os.chdir(ROOT)
+    only = set(args.only.split(","))
+    seed_all()
+
+    work = tempfile.mkdtemp(prefix="ai3-bench-")
+    try:
+        synthetic = args.model is None
+        model_path = args.model or build_synthetic_model(args.vocab.split(","), os.path.join(work, "model.pkl"), args.arch)
+
+        from fastai.learner import load_learner
+        from inference import model_input_size
+        learner = load_learner(model_path, cpu=True)
+        size = model_input_size(learner) or (224, 224)
+        min_side = max(size)
+        a = photo_like(1024, 768)
+        imgs = [Image.fromarray(a), Image.fromarray(a[:, ::-1].copy()), Image.fromarray(a[::-1].copy())]
+
+        res: dict = {}
+        if "decode" in only:
+            print("decode..."); bench_decode(res, min_side, [float(x) for x in args.sizes.split(",")], reps=max(3, args.n // 5))
+        if "predict" in only:
+            print("predict..."); bench_predict(res, learner, model_path, args.mode, imgs, args.n)
+        if "batch" in only:
+            threads = [int(x) for x in args.threads.split(",")] if args.threads else sorted({1, os.cpu_count() or 1})
+            print("batch..."); bench_batch(res, learner, model_path, args.mode, imgs, threads,
+                                           [int(x) for x in args.batch_sizes.split(",")], n=max(3, args.n // 5))
+        if "apptest" in only:
+            print("apptest..."); bench_apptest(res, model_path, args.mode, encode(a, "JPEG"), args.reruns,
+                                           work, [str(x) for x in learner.dls.vocab])
+
+        out = {"meta": environment(model_path, synthetic), "metrics": res}
+        for name, m in sorted(res.items()):
+            print(f"{name:<36} {m['value']:>10.3f} {m['unit']}")
+        if args.out:
+            with open(args.out, "w") as f: json.dump(out, f, indent=2, ensure_ascii=False)
+            print(f"\n저장: {args.out}")
+        if args.baseline:
+            with open(args.baseline) as f: base = json.load(f)
+            regressions = compare(out, base, args.threshold)
+            if regressions:
+                print(f"\n회귀 {len(regressions)}건 (>{args.threshold * 100:.0f}%): {', '.join(regressions)}")
+                sys.exit(1)
+            print("\n회귀 없음")
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
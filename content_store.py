@@ -0,0 +1,170 @@
+# content_store.py
+# 라벨별 고정 콘텐츠(텍스트/이미지/동영상)를 외부 매니페스트에서 필요할 때만 읽고,
+# 이미지·유튜브 썸네일은 축소본을 디스크 캐시(static/)에 만들어 URL로 제공
+import os, re, json, base64, hashlib, threading, urllib.request
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+
+
+def yt_id_from_url(url: str) -> str | None:
+    if not url: return None
+    pats = [r"(?:v=|/)([0-9A-Za-z_-]{11})(?:\?|&|/|$)", r"youtu\.be/([0-9A-Za-z_-]{11})"]
+    for p in pats:
+        m = re.search(p, url)
+        if m: return m.group(1)
+    return None
+
+
+def yt_thumb(url: str) -> str | None:
+    vid = yt_id_from_url(url)
+    return f"https://img.youtube.com/vi/{vid}/hqdefault.jpg" if vid else None
+
+
+def pick_top3(lst):
+    return [x for x in lst if isinstance(x, str) and x.strip()][:3]
+
+
+def load_manifest(path: str) -> dict:
+    """JSON 또는 YAML 매니페스트. 키는 라벨명, 또는 vocab 순서를 뜻하는 "#0", "#1"..."""
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            import yaml
+            return yaml.safe_load(f) or {}
+        return json.load(f)
+
+
+class ThumbCache:
+    """원본(URL/data URI/로컬 파일) -> 축소 JPEG 파일. 전체 용량이 max_bytes를 넘으면 오래된 것부터 삭제.
+
+    원격(http/https) 원본은 백그라운드 스레드에서 받아 만들고, 그동안 get()은 None을 돌려 원본 URL을 쓰게 한다.
+    """
+
+    def __init__(self, cache_dir: str, url_prefix: str, max_side: int = 480,
+                 max_bytes: int = 50 * 1024 * 1024, timeout: float = 5.0, fetch_workers: int = 2):
+        self.cache_dir, self.url_prefix = cache_dir, url_prefix.rstrip("/")
+        self.max_side, self.max_bytes, self.timeout = max_side, max_bytes, timeout
+        self._lock = threading.Lock()
+        self._failed: set[str] = set()  # 가져오기 실패한 원본은 rerun마다 다시 시도하지 않음
+        self._pending: set[str] = set()  # 백그라운드에서 받는 중인 원격 원본
+        self._pool = ThreadPoolExecutor(max_workers=fetch_workers, thread_name_prefix="thumb")
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _read_source(self, src: str, base_dir: str) -> bytes:
+        if src.startswith("data:"):
+            return base64.b64decode(src.split(",", 1)[1])
+        if src.startswith(("http://", "https://")):
+            req = urllib.request.Request(src, headers={"User-Agent": "Mozilla/5.0"})
+            with urllib.request.urlopen(req, timeout=self.timeout) as r:
+                return r.read()
+        with open(os.path.join(base_dir, src), "rb") as f:
+            return f.read()
+
+    def _build(self, src: str, base_dir: str, path: str) -> bool:
+        try:
+            pil = Image.open(BytesIO(self._read_source(src, base_dir)))
+            pil.draft("RGB", (self.max_side, self.max_side))
+            pil = pil.convert("RGB")
+            pil.thumbnail((self.max_side, self.max_side))
+        except Exception:
+            self._failed.add(src)
+            return False
+        with self._lock:
+            tmp = path + ".tmp"
+            pil.save(tmp, "JPEG", quality=85, optimize=True)
+            os.replace(tmp, path)
+            self._evict()
+        return True
+
+    def _fetch(self, src: str, base_dir: str, path: str):
+        try:
+            self._build(src, base_dir, path)
+        finally:
+            with self._lock:
+                self._pending.discard(src)
+
+    def get(self, src: str, base_dir: str = ".") -> str | None:
+        """썸네일 URL. 아직 없거나 만들 수 없으면 None (원격 이미지면 호출 측에서 원본 URL 사용).
+
+        로컬 파일/data URI는 바로 만들고, 원격 원본은 rerun을 막지 않도록 백그라운드에서 받아 다음 rerun부터 쓴다.
+        """
+        name = hashlib.sha1(f"{src}|{self.max_side}".encode()).hexdigest()[:20] + ".jpg"
+        path = os.path.join(self.cache_dir, name)
+        try:
+            os.utime(path)  # 있으면 LRU 순서 갱신
+            return f"{self.url_prefix}/{name}"
+        except FileNotFoundError:
+            pass  # 없거나 다른 스레드의 _evict가 방금 지움: 새로 만든다
+        if src in self._failed: return None
+        if src.startswith(("http://", "https://")):
+            with self._lock:
+                if src in self._pending: return None
+                self._pending.add(src)
+            self._pool.submit(self._fetch, src, base_dir, path)
+            return None
+        return f"{self.url_prefix}/{name}" if self._build(src, base_dir, path) else None
+
+    def _evict(self):
+        files = [os.path.join(self.cache_dir, f) for f in os.listdir(self.cache_dir) if f.endswith(".jpg")]
+        stats = sorted(((os.stat(p), p) for p in files), key=lambda x: x[0].st_mtime)
+        total = sum(s.st_size for s, _ in stats)
+        for s, p in stats:
+            if total <= self.max_bytes: break
+            os.remove(p)
+            total -= s.st_size
+
+    def usage(self) -> dict:
+        files = [f for f in os.listdir(self.cache_dir) if f.endswith(".jpg")]
+        size = sum(os.path.getsize(os.path.join(self.cache_dir, f)) for f in files)
+        return {"files": len(files), "bytes": size, "max_bytes": self.max_bytes}
+
+
+class ContentStore:
+    """매니페스트를 learner.dls.vocab에 맞춰 해석하고, 라벨별 콘텐츠는 요청될 때만 준비.
+
+    썸네일은 디스크 캐시에 있으면 그대로 쓰므로 원본 다운로드/base64 디코딩은 처음 한 번뿐이다.
+    """
+
+    def __init__(self, manifest_path: str, vocab, thumbs: ThumbCache | None = None):
+        self.base_dir = os.path.dirname(os.path.abspath(manifest_path))
+        self.vocab = [str(x) for x in vocab]
+        self.thumbs = thumbs
+        raw = load_manifest(manifest_path)
+        self._entries: dict[str, dict] = {}
+        for k, v in raw.items():
+            k = str(k)
+            if k.startswith("#") and k[1:].isdigit():
+                i = int(k[1:])
+                if i < len(self.vocab): self._entries.setdefault(self.vocab[i], v)
+            else:
+                self._entries[k] = v  # 라벨명 키가 "#i"보다 우선
+
+    def __contains__(self, label: str) -> bool:
+        return label in self._entries
+
+    def raw(self, label: str) -> dict:
+        """매니페스트 원본 항목 (썸네일 처리 없음, API 응답용). 로컬 미디어는 매니페스트 기준 경로."""
+        cfg = self._entries.get(label, {})
+        return {k: pick_top3(cfg.get(k, [])) for k in ("texts", "images", "videos")}
+
+    def get(self, label: str):
+        """(texts, images, videos). images는 썸네일 URL, videos는 (원본 URL, 썸네일 URL 또는 None).
+
+        thumbs가 없으면 원본을 그대로 쓴다: 원격 URL·data URI는 그대로, 로컬 파일은 제공할 수 없어 생략.
+        """
+        cfg = self._entries.get(label, {})
+        texts = pick_top3(cfg.get("texts", []))
+        images = []
+        for src in pick_top3(cfg.get("images", [])):
+            if self.thumbs is None:
+                url = src if src.startswith(("http://", "https://", "data:")) else None
+            else:
+                url = self.thumbs.get(src, self.base_dir)
+                if url is None and src.startswith(("http://", "https://")): url = src
+            if url: images.append(url)
+        videos = []
+        for v in pick_top3(cfg.get("videos", [])):
+            t = yt_thumb(v)
+            if t and self.thumbs is not None: t = self.thumbs.get(t) or t
+            videos.append((v, t))
+        return texts, images, videos
@@ -0,0 +1,131 @@
+# export_backends.py
+# Learner 모델 + 정규화 + 활성함수를 하나의 그래프로 내보내 TorchScript / ONNX Runtime / int8로 추론
+import os, hashlib, inspect
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+from PIL import Image
+
+from inference import LeanPredictor
+from pred_cache import model_identity
+
+
+class ExportWrapper(nn.Module):
+    """uint8 범위(0~255)의 float NCHW 입력 -> 확률. 정규화/활성함수를 그래프 안에 포함."""
+
+    def __init__(self, model: nn.Module, div: float, mean, std, activation=None):
+        super().__init__()
+        self.model = model
+        self.div = div
+        self.register_buffer("mean", mean if mean is not None else torch.zeros(1, 3, 1, 1))
+        self.register_buffer("std", std if std is not None else torch.ones(1, 3, 1, 1))
+        self.activation = activation
+
+    def forward(self, x):
+        x = (x / self.div - self.mean) / self.std
+        out = self.model(x)
+        if isinstance(out, (tuple, list)): out = out[0]
+        return self.activation(out) if self.activation is not None else F.softmax(out, dim=-1)
+
+
+def artifact_path(model_path: str, kind: str) -> str:
+    """MODEL_PATH 옆에 모델 파일 식별자 해시를 붙여 저장. 모델이 바뀌면 새로 내보낸다."""
+    ext = {"torchscript": "ts.pt", "onnx": "onnx", "int8": "int8.ts.pt"}[kind]
+    stem = os.path.splitext(model_path)[0]
+    h = hashlib.sha1(model_identity(model_path).encode()).hexdigest()[:10]
+    return f"{stem}.{h}.{ext}"
+
+
+def _wrapper_from(lean: LeanPredictor) -> ExportWrapper:
+    if lean._batch_fallback is not None:
+        raise ValueError("지원하지 않는 batch 변환이 있어 정규화를 그래프에 포함할 수 없습니다.")
+    return ExportWrapper(lean.model, lean.div, lean.mean, lean.std, lean.activation).eval()
+
+
+def _example_input(lean: LeanPredictor) -> tuple[torch.Tensor, bool]:
+    """실제 전처리(to_tensor)를 거친 샘플 배치와, 입력 크기에 따라 H·W가 달라지는지 여부.
+
+    Resize가 없거나 fallback 변환(RandomResizedCrop 등)이어도 내보낸 그래프가 실제 입력 모양과 맞는다.
+    """
+    a, b = (lean.to_tensor(Image.new("RGB", size, (128, 128, 128))) for size in ((224, 224), (320, 256)))
+    return a.unsqueeze(0).float(), a.shape != b.shape
+
+
+def export_torchscript(lean: LeanPredictor, path: str, quantize: bool = False) -> str:
+    wrapper = _wrapper_from(lean)
+    if quantize:
+        # 동적 양자화: Linear 계층 가중치를 int8로 (Conv는 그대로 float)
+        wrapper = torch.ao.quantization.quantize_dynamic(wrapper, {nn.Linear}, dtype=torch.qint8)
+    with torch.no_grad():
+        ts = torch.jit.trace(wrapper, _example_input(lean)[0])
+    ts = torch.jit.freeze(ts)
+    tmp = path + ".tmp"
+    ts.save(tmp)
+    os.replace(tmp, path)
+    return path
+
+
+def export_onnx(lean: LeanPredictor, path: str, opset: int = 17) -> str:
+    wrapper = _wrapper_from(lean)
+    x, dynamic_hw = _example_input(lean)
+    # 전처리가 크기를 고정하지 않으면 H·W도 동적 축으로
+    in_axes = {0: "batch", 2: "height", 3: "width"} if dynamic_hw else {0: "batch"}
+    # 기존(TorchScript 기반) 내보내기: 최신 torch 기본값인 dynamo는 onnxscript가 필요하고
+    # 가중치를 별도 <파일>.data로 써서 아래 rename 뒤 경로가 어긋난다. 구버전 torch엔 인자 자체가 없음
+    legacy = {"dynamo": False} if "dynamo" in inspect.signature(torch.onnx.export).parameters else {}
+    tmp = path + ".tmp"
+    with torch.no_grad():
+        torch.onnx.export(
+            wrapper, x, tmp, opset_version=opset,
+            input_names=["input"], output_names=["probs"],
+            dynamic_axes={"input": in_axes, "probs": {0: "batch"}}, **legacy,
+        )
+    os.replace(tmp, path)
+    return path
+
+
+class TorchScriptPredictor(LeanPredictor):
+    """전처리는 LeanPredictor와 동일, 모델 호출만 TorchScript로."""
+    name = "torchscript"
+
+    def __init__(self, learner, model_path: str, threads: int | None = None, quantize: bool = False):
+        super().__init__(learner)
+        if quantize: self.name = "int8"
+        if threads: torch.set_num_threads(threads)
+        path = artifact_path(model_path, self.name)
+        if not os.path.exists(path):
+            export_torchscript(self, path, quantize=quantize)
+        self.artifact = path
+        self.ts = torch.jit.load(path, map_location="cpu").eval()
+
+    def forward(self, xb: torch.Tensor) -> torch.Tensor:
+        with torch.inference_mode():
+            return self.ts(xb.float()).float()
+
+
+class OnnxPredictor(LeanPredictor):
+    """ONNX Runtime CPU 실행. threads로 intra-op 스레드 수 제어."""
+    name = "onnx"
+
+    def __init__(self, learner, model_path: str, threads: int | None = None):
+        import onnxruntime as ort
+        super().__init__(learner)
+        path = artifact_path(model_path, self.name)
+        if not os.path.exists(path):
+            export_onnx(self, path)
+        self.artifact = path
+        so = ort.SessionOptions()
+        if threads: so.intra_op_num_threads = threads
+        so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(path, so, providers=["CPUExecutionProvider"])
+
+    def forward(self, xb: torch.Tensor) -> torch.Tensor:
+        out = self.session.run(["probs"], {"input": xb.float().numpy()})[0]
+        return torch.from_numpy(out)
+
+
+def make_export_predictor(learner, mode: str, model_path: str, threads: int | None = None):
+    if mode == "torchscript": return TorchScriptPredictor(learner, model_path, threads)
+    if mode == "int8": return TorchScriptPredictor(learner, model_path, threads, quantize=True)
+    if mode == "onnx": return OnnxPredictor(learner, model_path, threads)
+    raise ValueError(f"알 수 없는 내보내기 백엔드: {mode}")
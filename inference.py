@@ -0,0 +1,246 @@
+# inference.py
+# fastai Learner에서 모델/전처리를 꺼내 DataLoader 없이 바로 추론하는 경량 예측기
+import time, statistics
+import numpy as np
+import torch
+import torch.nn.functional as F
+from PIL import Image
+
+from metrics import stage
+
+
+class FastaiPredictor:
+    """기존 경로: learner.predict 그대로 사용 (기준/비교용)."""
+    name = "fastai"
+
+    def __init__(self, learner):
+        self.learner = learner
+        self.vocab = [str(x) for x in learner.dls.vocab]
+
+    def predict(self, pil: Image.Image):
+        from fastai.vision.core import PILImage
+        with stage("convert"):
+            item = PILImage.create(np.array(pil))
+        with stage("predict"):
+            pred, pred_idx, probs = self.learner.predict(item)
+        return str(pred), int(pred_idx), [float(p) for p in probs]
+
+    def predict_batch(self, pils):
+        """여러 장은 test_dl 하나로 묶어 get_preds 한 번에 처리."""
+        if len(pils) <= 1: return [self.predict(p) for p in pils]
+        from fastai.vision.core import PILImage
+        with stage("convert"):
+            items = [PILImage.create(np.array(p)) for p in pils]
+        with stage("predict"), self.learner.no_bar():
+            dl = self.learner.dls.test_dl(items, bs=len(pils), num_workers=0)
+            probs, _ = self.learner.get_preds(dl=dl)
+        res = []
+        for row in probs:
+            idx = int(row.argmax())
+            res.append((self.vocab[idx], idx, [float(p) for p in row]))
+        return res
+
+
+# ----------------------
+# 전처리 추출
+# ----------------------
+def _tfm_name(t) -> str:
+    return type(t).__name__
+
+
+def _find_tfm(pipeline, name):
+    for t in getattr(pipeline, "fs", []):
+        if _tfm_name(t) == name: return t
+    return None
+
+
+def _valid_pipeline(pipeline):
+    """검증 모드(split_idx=1) 파이프라인. RandomResizedCrop 등이 무작위 대신 중앙 crop을 하도록."""
+    from fastai.data.all import Pipeline  # 공개 경로 (fastcore → fasttransform 이동과 무관)
+    return Pipeline(pipeline.fs, split_idx=1)
+
+
+def _active_tfms(pipeline):
+    """검증(split_idx=1) 시 실제로 실행되는 변환만 반환. 학습 전용 증강은 제외."""
+    out = []
+    for t in getattr(pipeline, "fs", []):
+        sidx = getattr(t, "split_idx", None)
+        if sidx is not None and sidx != 1: continue
+        out.append(t)
+    return out
+
+
+def model_input_size(learner) -> tuple[int, int] | None:
+    """Learner의 Resize 변환 크기 (w, h). 없으면 None."""
+    t = _find_tfm(learner.dls.after_item, "Resize")
+    return (int(t.size[0]), int(t.size[1])) if t is not None else None
+
+
+class ResizeSpec:
+    """fastai Resize(검증 모드: 중앙 crop, pcts=0.5)를 PIL 연산으로 재현."""
+
+    def __init__(self, size_wh: tuple[int, int], method: str, pad_mode: str, resample):
+        self.size = size_wh
+        self.method = method
+        self.pad_mode = pad_mode
+        self.resample = resample
+
+    @classmethod
+    def from_tfm(cls, t):
+        w, h = int(t.size[0]), int(t.size[1])  # fastai는 (w, h)로 저장
+        return cls((w, h), str(t.method), str(t.pad_mode), getattr(t, "mode", Image.BILINEAR))
+
+    def __call__(self, pil: Image.Image) -> Image.Image:
+        tw, th = self.size
+        w, h = pil.size
+        if self.method == "squish":
+            return pil.resize((tw, th), self.resample)
+        # crop: 짧은 쪽 기준으로 잘라냄 / pad: 긴 쪽 기준으로 덧댐
+        m = min(w / tw, h / th) if self.method == "crop" else max(w / tw, h / th)
+        cw, ch = int(m * tw), int(m * th)
+        l, t = int(0.5 * (w - cw)), int(0.5 * (h - ch))
+        if l >= 0 and t >= 0 and cw <= w and ch <= h:
+            return pil.crop((l, t, l + cw, t + ch)).resize((tw, th), self.resample)
+        # 패딩이 필요한 경우 (pad 방식)
+        x = pil.crop((max(l, 0), max(t, 0), min(l + cw, w), min(t + ch, h)))
+        pads = (max(-l, 0), max(-t, 0), max(l + cw - w, 0), max(t + ch - h, 0))
+        x = pad_pil(x, pads, self.pad_mode)
+        return x.resize((tw, th), self.resample)
+
+
+def pad_pil(pil: Image.Image, pads, pad_mode: str) -> Image.Image:
+    """pads = (left, top, right, bottom). fastai PadMode(zeros/border/reflection) 대응."""
+    mode = {"zeros": "constant", "border": "edge", "reflection": "reflect"}.get(pad_mode, "reflect")
+    a = np.asarray(pil)
+    l, t, r, b = pads
+    a = np.pad(a, ((t, b), (l, r), (0, 0)), mode=mode)
+    return Image.fromarray(a)
+
+
+class LeanPredictor:
+    """Learner에서 모델과 item/batch 변환을 꺼내 torch 연산만으로 추론.
+
+    알 수 없는 변환이 있으면 해당 단계만 fastai 검증(valid) 파이프라인으로 대체한다.
+    """
+    name = "lean"
+
+    def __init__(self, learner):
+        dls = learner.dls
+        valid = dls.valid  # 학습용 dl의 파이프라인은 split_idx가 없어 무작위 증강이 적용됨
+        self.vocab = [str(x) for x in dls.vocab]
+        self.model = learner.model.eval().cpu()
+        self.activation = getattr(learner.loss_func, "activation", None)
+
+        # item 변환: Resize + ToTensor 만 지원
+        item_tfms = _active_tfms(dls.after_item)
+        names = [_tfm_name(t) for t in item_tfms]
+        self.resize = ResizeSpec.from_tfm(_find_tfm(dls.after_item, "Resize")) if "Resize" in names else None
+        self._item_fallback = None if set(names) <= {"Resize", "ToTensor"} else _valid_pipeline(valid.after_item)
+
+        # batch 변환: IntToFloatTensor + Normalize 만 지원
+        batch_tfms = _active_tfms(dls.after_batch)
+        names = [_tfm_name(t) for t in batch_tfms]
+        i2f = _find_tfm(dls.after_batch, "IntToFloatTensor")
+        self.div = float(getattr(i2f, "div", 255.0)) if i2f is not None else 1.0
+        norm = _find_tfm(dls.after_batch, "Normalize")
+        if norm is not None:
+            self.mean = norm.mean.detach().cpu().float().view(1, -1, 1, 1)
+            self.std = norm.std.detach().cpu().float().view(1, -1, 1, 1)
+        else:
+            self.mean = self.std = None
+        self._batch_fallback = None if set(names) <= {"IntToFloatTensor", "Normalize"} else _valid_pipeline(valid.after_batch)
+
+    # ---- 전처리 ----
+    def to_tensor(self, pil: Image.Image) -> torch.Tensor:
+        """PIL(RGB) -> uint8 CHW 텐서."""
+        if self._item_fallback is not None:
+            from fastai.vision.core import PILImage
+            return torch.as_tensor(self._item_fallback(PILImage.create(np.array(pil))))
+        if self.resize is not None:
+            pil = self.resize(pil)
+        a = np.asarray(pil.convert("RGB"))
+        return torch.from_numpy(a.copy()).permute(2, 0, 1)
+
+    def normalize(self, xb: torch.Tensor) -> torch.Tensor:
+        """uint8 NCHW 배치 -> 모델 입력 float 배치."""
+        if self._batch_fallback is not None:
+            from fastai.torch_core import TensorImage
+            return torch.as_tensor(self._batch_fallback(TensorImage(xb)))
+        x = xb.float().div_(self.div)
+        if self.mean is not None:
+            x = (x - self.mean) / self.std
+        return x
+
+    # ---- 추론 ----
+    def forward(self, xb: torch.Tensor) -> torch.Tensor:
+        """전처리된 uint8 배치 -> 확률 (N, C)."""
+        with torch.inference_mode():
+            out = self.model(self.normalize(xb))
+            if isinstance(out, (tuple, list)): out = out[0]
+            out = self.activation(out) if self.activation is not None else F.softmax(out, dim=-1)
+        return out.float()
+
+    def _decode(self, probs: torch.Tensor):
+        res = []
+        for row in probs:
+            idx = int(row.argmax())
+            res.append((self.vocab[idx], idx, [float(p) for p in row]))
+        return res
+
+    def predict(self, pil: Image.Image):
+        return self.predict_batch([pil])[0]
+
+    def predict_batch(self, pils):
+        if not pils: return []
+        with stage("preprocess"):
+            xb = torch.stack([self.to_tensor(p) for p in pils])
+        with stage("forward"):
+            probs = self.forward(xb)
+        return self._decode(probs)
+
+
+PREDICTORS = {"fastai": FastaiPredictor, "lean": LeanPredictor}
+# 내보내기(export) 기반 백엔드: export_backends.py 에서 지연 로드
+EXPORT_BACKENDS = ("torchscript", "onnx", "int8")
+
+
+def make_predictor(learner, mode: str = "lean", model_path: str | None = None, threads: int | None = None):
+    if mode in EXPORT_BACKENDS:
+        from export_backends import make_export_predictor
+        return make_export_predictor(learner, mode, model_path or "model.pkl", threads)
+    if mode not in PREDICTORS:
+        raise ValueError(f"알 수 없는 예측 모드: {mode} (가능: {', '.join([*PREDICTORS, *EXPORT_BACKENDS])})")
+    return PREDICTORS[mode](learner)
+
+
+def check_parity(learner, pils, atol: float = 1e-4, predictor=None) -> float:
+    """learner.predict와 predictor(기본 LeanPredictor) 확률의 최대 절대 오차.
+
+    라벨이 다르거나 atol 초과 시 AssertionError.
+    """
+    ref, other = FastaiPredictor(learner), predictor or LeanPredictor(learner)
+    worst = 0.0
+    for p in pils:
+        a, b = ref.predict(p), other.predict(p)
+        assert a[0] == b[0], f"라벨 불일치 ({other.name}): {a[0]} != {b[0]}"
+        worst = max(worst, max(abs(x - y) for x, y in zip(a[2], b[2])))
+    assert worst <= atol, f"확률 불일치 ({other.name}): max|diff|={worst:.2e} > {atol:.0e}"
+    return worst
+
+
+def measure_latency(predictor, pils, n: int = 50, batch_size: int = 1, warmup: int = 3) -> dict:
+    """배치 단위 지연시간 p50/p95(ms)와 처리량(img/s)."""
+    batches = [[pils[(i * batch_size + j) % len(pils)] for j in range(batch_size)] for i in range(n)]
+    for b in batches[:warmup]: predictor.predict_batch(b)
+    ts = []
+    for b in batches:
+        t0 = time.perf_counter()
+        predictor.predict_batch(b)
+        ts.append(time.perf_counter() - t0)
+    ts.sort()
+    return {
+        "backend": predictor.name, "batch_size": batch_size,
+        "p50_ms": statistics.median(ts) * 1000,
+        "p95_ms": ts[int(0.95 * (len(ts) - 1))] * 1000,
+        "throughput": n * batch_size / sum(ts),
+    }
@@ -0,0 +1,55 @@
+# ingest.py
+# 업로드 이미지를 한 번만, 필요한 해상도로만 디코딩 (표시/추론 공용 버퍼)
+import math
+from io import BytesIO
+from PIL import Image, ImageOps
+
+MAX_BYTES = 30 * 1024 * 1024       # 업로드 파일 크기 상한
+MAX_PIXELS = 50_000_000            # 헤더 기준 픽셀 수 상한 (디컴프레션 밤 방지)
+DISPLAY_MAX_SIDE = 1024            # 화면 표시용 긴 변 상한 (draft로 이미 더 작아졌으면 그 크기 그대로 표시)
+
+
+class IngestError(ValueError):
+    """너무 크거나 읽을 수 없는 입력."""
+
+
+def target_scale(w: int, h: int, min_side: int, max_side: int) -> float:
+    """긴 변은 max_side 이하로 줄이되, 짧은 변은 min_side(모델 입력) 아래로 내려가지 않는 배율."""
+    s = max(max_side / max(w, h), min_side / min(w, h))
+    return min(1.0, s)
+
+
+def ingest_image(b: bytes, min_side: int = 224, max_side: int = DISPLAY_MAX_SIDE,
+                 max_bytes: int = MAX_BYTES, max_pixels: int = MAX_PIXELS) -> Image.Image:
+    """바이트 -> 축소된 RGB PIL 이미지 (EXIF 회전 반영).
+
+    JPEG는 draft 모드로 DCT 단계에서 1/2·1/4·1/8 축소 디코딩해 전체 해상도 버퍼를 만들지 않는다.
+    draft 목표는 모델 입력(min_side)만으로 정한다: 짧은 변이 min_side 이상인 가장 작은 배율.
+    표시도 같은 버퍼를 쓰므로 화면 이미지는 max_side보다 작을 수 있다 (추론 해상도 우선).
+    """
+    if len(b) > max_bytes:
+        raise IngestError(f"파일이 너무 큽니다 ({len(b) / 2**20:.1f} MB > {max_bytes / 2**20:.0f} MB)")
+    try:
+        pil = Image.open(BytesIO(b))
+    except Exception as e:
+        raise IngestError(f"이미지를 읽을 수 없습니다: {e}") from e
+    w, h = pil.size
+    if w * h > max_pixels:
+        raise IngestError(f"해상도가 너무 큽니다 ({w}x{h} > {max_pixels / 1e6:.0f} MP)")
+
+    s = min(1.0, min_side / min(w, h))
+    if s < 1.0 and pil.format == "JPEG":
+        # draft는 요청 크기 이상이 되도록 가장 작은 축소 배율을 고른다. 회전 전이므로 배율만 같으면 된다.
+        pil.draft("RGB", (math.ceil(w * s), math.ceil(h * s)))
+    try:
+        pil.load()
+    except Exception as e:
+        raise IngestError(f"이미지를 디코딩할 수 없습니다: {e}") from e
+
+    pil = ImageOps.exif_transpose(pil)
+    if pil.mode != "RGB": pil = pil.convert("RGB")
+    w, h = pil.size
+    s = target_scale(w, h, min_side, max_side)
+    if s < 1.0:
+        pil = pil.resize((max(1, round(w * s)), max(1, round(h * s))), Image.BICUBIC, reducing_gap=3.0)
+    return pil
@@ -0,0 +1,165 @@
+# metrics.py
+# 파이프라인 단계별 시간/메모리 계측 + 프로세스 전체 Prometheus 텍스트 형식 지표
+import os, io, time, tempfile, threading, contextvars
+from contextlib import contextmanager
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PREFIX = "classifier"
+
+
+def rss_bytes() -> int:
+    """현재 RSS. Linux는 /proc, 그 외는 최대 RSS(ru_maxrss)로 대체."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class Histogram:
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, v: float):
+        for i, b in enumerate(self.buckets):
+            if v <= b: self.counts[i] += 1
+        self.sum += v
+        self.count += 1
+
+
+def _fmt_labels(labels: tuple) -> str:
+    return "{" + ",".join(f'{k}="{v}"' for k, v in labels) + "}" if labels else ""
+
+
+class Registry:
+    """히스토그램/카운터 + 내보낼 때 호출되는 게이지 수집 함수."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms: dict[tuple[str, tuple], Histogram] = {}
+        self.counters: dict[tuple[str, tuple], float] = {}
+        self._gauge_fns = []
+
+    def observe(self, name: str, value: float, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            h = self.histograms.get(key)
+            if h is None: h = self.histograms[key] = Histogram()
+            h.observe(value)
+
+    def inc(self, name: str, value: float = 1.0, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0.0) + value
+
+    def add_gauges(self, fn):
+        """fn() -> {(이름, ((라벨, 값), ...)): 값}. 내보낼 때마다 호출."""
+        with self._lock:
+            self._gauge_fns.append(fn)
+
+    def render(self) -> str:
+        out = io.StringIO()
+        with self._lock:
+            hists = sorted(self.histograms.items())
+            counters = sorted(self.counters.items())
+            gauge_fns = list(self._gauge_fns)
+        for (name, labels), h in hists:
+            base = f"{PREFIX}_{name}"
+            for b, c in zip(h.buckets, h.counts):
+                out.write(f"{base}_bucket{_fmt_labels(labels + (('le', b),))} {c}\n")
+            out.write(f"{base}_bucket{_fmt_labels(labels + (('le', '+Inf'),))} {h.count}\n")
+            out.write(f"{base}_sum{_fmt_labels(labels)} {h.sum:.6f}\n")
+            out.write(f"{base}_count{_fmt_labels(labels)} {h.count}\n")
+        for (name, labels), v in counters:
+            out.write(f"{PREFIX}_{name}{_fmt_labels(labels)} {v:g}\n")
+        for fn in gauge_fns:
+            try:
+                gauges = fn()
+            except Exception:
+                continue
+            for (name, labels), v in sorted(gauges.items()):
+                out.write(f"{PREFIX}_{name}{_fmt_labels(labels)} {float(v):g}\n")
+        return out.getvalue()
+
+    def write(self, path: str):
+        """원자적으로 파일에 기록 (node_exporter textfile collector 등에서 읽기).
+
+        임시 파일은 호출마다 같은 디렉터리에 고유 이름으로 만들어 동시 기록끼리 덮어쓰지 않는다.
+        """
+        d, base = os.path.split(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(prefix=f".{base}.", suffix=".tmp", dir=d)
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(self.render())
+            os.chmod(tmp, 0o644)  # mkstemp는 0600: 수집기가 다른 사용자여도 읽을 수 있게
+            os.replace(tmp, path)
+        except BaseException:
+            try: os.unlink(tmp)
+            except OSError: pass
+            raise
+
+
+REGISTRY = Registry()
+
+# 현재 요청(세션 rerun)의 단계 기록. 같은 스레드/컨텍스트에서 실행된 stage만 모인다.
+_trace: contextvars.ContextVar[list | None] = contextvars.ContextVar("trace", default=None)
+
+
+@contextmanager
+def trace():
+    """with trace() as tr: ...  → tr = [(단계, 초, RSS 증가 바이트), ...]"""
+    tr: list = []
+    token = _trace.set(tr)
+    try:
+        yield tr
+    finally:
+        _trace.reset(token)
+
+
+def start_trace() -> list:
+    """with 블록으로 감싸기 어려운 곳(Streamlit 스크립트 rerun)용: 현재 컨텍스트에 새 trace 시작."""
+    tr: list = []
+    _trace.set(tr)
+    return tr
+
+
+@contextmanager
+def stage(name: str):
+    """단계 시간/메모리 측정: 전역 히스토그램 + 진행 중인 trace에 기록."""
+    t0, m0 = time.perf_counter(), rss_bytes()
+    try:
+        yield
+    finally:
+        dt = time.perf_counter() - t0
+        REGISTRY.observe("stage_seconds", dt, stage=name)
+        tr = _trace.get()
+        if tr is not None: tr.append((name, dt, rss_bytes() - m0))
+
+
+@contextmanager
+def profile(kind: str | None):
+    """kind: None / "cprofile" / "torch". 끝나면 holder["report"]에 상위 항목 텍스트."""
+    holder: dict = {"report": None}
+    if not kind:
+        yield holder
+        return
+    if kind == "torch":
+        from torch.profiler import profile as tprofile, ProfilerActivity
+        with tprofile(activities=[ProfilerActivity.CPU], record_shapes=True, profile_memory=True) as prof:
+            yield holder
+        holder["report"] = prof.key_averages().table(sort_by="self_cpu_time_total", row_limit=25)
+        return
+    import cProfile, pstats
+    pr = cProfile.Profile()
+    pr.enable()
+    try:
+        yield holder
+    finally:
+        pr.disable()
+        buf = io.StringIO()
+        pstats.Stats(pr, stream=buf).sort_stats("cumulative").print_stats(25)
+        holder["report"] = buf.getvalue()
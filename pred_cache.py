@@ -0,0 +1,75 @@
+# pred_cache.py
+# 이미지 바이트 해시 + 모델 파일 식별자로 예측 결과를 캐시 (세션 간 공유)
+import os, time, hashlib, threading
+from collections import OrderedDict
+
+
+def model_identity(path: str) -> str:
+    """모델 파일 식별자: 경로 + 크기 + 수정시각. 파일이 바뀌면 캐시 키도 바뀐다."""
+    try:
+        s = os.stat(path)
+    except OSError:
+        return f"{os.path.abspath(path)}:missing"
+    return f"{os.path.abspath(path)}:{s.st_size}:{s.st_mtime_ns}"
+
+
+def image_key(b: bytes, model_id: str) -> str:
+    h = hashlib.sha256(b).hexdigest()
+    return f"{model_id}|{h}"
+
+
+class PredictionCache:
+    """(pred, pred_idx, probs)를 담는 스레드 안전 LRU + TTL 캐시."""
+
+    def __init__(self, max_items: int = 256, ttl: float | None = 3600.0):
+        self.max_items = max_items
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, tuple]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str):
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and self.ttl is not None and time.monotonic() - item[0] > self.ttl:
+                del self._data[key]
+                self.evictions += 1
+                item = None
+            if item is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def put(self, key: str, value: tuple):
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_items:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key: str, fn):
+        """캐시에 있으면 반환, 없으면 fn()을 실행해 저장. (value, hit 여부) 반환."""
+        v = self.get(key)
+        if v is not None:
+            return v, True
+        v = fn()
+        self.put(key, v)
+        return v, False
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data), "max_items": self.max_items,
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "hit_rate": (self.hits / total) if total else 0.0,
+            }
@@ -0,0 +1,118 @@
+# startup.py
+# 무거운 import · 모델 다운로드 · 예열(warm-up)을 백그라운드 스레드에서 진행
+import os, time, hashlib, importlib, threading
+
+PROCESS_T0 = time.perf_counter()  # 프로세스(이 모듈 import) 시작 시각
+
+
+class StartupError(RuntimeError):
+    """모델 다운로드/검증/로드 실패."""
+
+
+def sha256_file(path: str, chunk: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for blk in iter(lambda: f.read(chunk), b""):
+            h.update(blk)
+    return h.hexdigest()
+
+
+def download_model(file_id: str, output_path: str, sha256: str | None = None, quiet: bool = True) -> str:
+    """Google Drive에서 `output_path.part`로 이어받기 다운로드 → 체크섬 확인 → 원자적 rename.
+
+    중간에 끊겨도 `.part`만 남으므로 반쯤 쓰인 model.pkl을 로드하는 일이 없다.
+    """
+    import gdown
+    if os.path.exists(output_path):
+        if sha256 and sha256_file(output_path) != sha256.lower():
+            raise StartupError(f"{output_path} 체크섬 불일치. 파일을 삭제 후 다시 시도하세요.")
+        return output_path
+    tmp = output_path + ".part"
+    url = f"https://drive.google.com/uc?id={file_id}"
+    if gdown.download(url, tmp, quiet=quiet, resume=True) is None or not os.path.exists(tmp):
+        raise StartupError("모델 다운로드 실패")
+    if sha256:
+        got = sha256_file(tmp)
+        if got != sha256.lower():
+            os.remove(tmp)
+            raise StartupError(f"다운로드한 모델의 체크섬 불일치: {got}")
+    os.replace(tmp, output_path)
+    return output_path
+
+
+class ModelStartup:
+    """import → 다운로드 → 로드 → 예측기 생성 → 더미 추론을 백그라운드로 실행.
+
+    stage / timings 로 진행 상황을, ready 이벤트로 완료를 알린다.
+    """
+
+    def __init__(self, file_id: str, output_path: str, mode: str = "lean",
+                 threads: int | None = None, sha256: str | None = None):
+        self.file_id, self.output_path = file_id, output_path
+        self.mode, self.threads, self.sha256 = mode, threads, sha256
+        self.stage = "대기"
+        self.timings: dict[str, float] = {}
+        self.error: BaseException | None = None
+        self.learner = self.predictor = None
+        self.input_size: tuple[int, int] | None = None
+        self.ready = threading.Event()
+        self.first_prediction_s: float | None = None
+        self._download_error: BaseException | None = None
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="model-startup", daemon=True)
+
+    def start(self) -> "ModelStartup":
+        self._thread.start()
+        return self
+
+    def _step(self, name: str, fn, stage: str | None = None):
+        self.stage = stage or name
+        t0 = time.perf_counter()
+        out = fn()
+        self.timings[name] = time.perf_counter() - t0
+        return out
+
+    def _run(self):
+        try:
+            # 다운로드(네트워크 대기)와 import(CPU)를 동시에 진행
+            dl = threading.Thread(target=self._download, name="model-download", daemon=True)
+            dl.start()
+            self._step("import", lambda: (importlib.import_module("torch"),
+                                          importlib.import_module("fastai.vision.all")), stage="import+download")
+            self.stage = "download"
+            dl.join()
+            if self._download_error is not None: raise self._download_error
+            from fastai.learner import load_learner
+            self.learner = self._step("load", lambda: load_learner(self.output_path, cpu=True))
+            from inference import make_predictor, model_input_size
+            self.predictor = self._step("predictor", lambda: make_predictor(
+                self.learner, self.mode, model_path=self.output_path, threads=self.threads))
+            self.input_size = model_input_size(self.learner)
+            self._step("warmup", lambda: self._warmup(self.input_size))
+            self.stage = "완료"
+        except BaseException as e:
+            self.error = e  # stage는 실패한 단계로 남겨 둔다
+        finally:
+            self.timings["total"] = time.perf_counter() - PROCESS_T0
+            self.ready.set()
+
+    def _download(self):
+        try:
+            t0 = time.perf_counter()
+            download_model(self.file_id, self.output_path, self.sha256)
+            self.timings["download"] = time.perf_counter() - t0
+        except BaseException as e:
+            self._download_error = e
+
+    def _warmup(self, size):
+        from PIL import Image
+        self.predictor.predict(Image.new("RGB", size or (224, 224)))
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self.ready.wait(timeout)
+
+    def mark_prediction(self):
+        """첫 예측 완료 시각 기록 → time-to-first-prediction."""
+        with self._lock:
+            if self.first_prediction_s is None:
+                self.first_prediction_s = time.perf_counter() - PROCESS_T0
@@ -0,0 +1,4 @@
+# 저장소 루트의 모듈(content_store 등)을 tests/에서 바로 import
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,95 @@
+# tests/test_batcher.py
+# DynamicBatcher: 배치 묶기, 결과 순서, 오류 전파, 종료 시 대기 요청 처리
+import threading
+
+import pytest
+
+from batcher import DynamicBatcher, QueueFull
+
+
+@pytest.fixture
+def make():
+    made = []
+    def _make(fn, **kw):
+        b = DynamicBatcher(fn, **kw)
+        made.append(b)
+        return b
+    yield _make
+    for b in made: b.close()
+
+
+def test_results_follow_submit_order(make):
+    seen = []
+    def fn(xs):
+        seen.append(list(xs))
+        return [x * 10 for x in xs]
+    b = make(fn, max_batch=8, max_wait_ms=50)
+    futs = [b.submit(i) for i in range(5)]
+    assert [f.result(timeout=2) for f in futs] == [0, 10, 20, 30, 40]
+    assert sum(len(s) for s in seen) == 5 and max(len(s) for s in seen) <= 8
+    assert b.stats()["items"] == 5
+
+
+def test_batch_is_capped_at_max_batch(make):
+    gate = threading.Event()
+    sizes = []
+    def fn(xs):
+        gate.wait(2)
+        sizes.append(len(xs))
+        return list(xs)
+    b = make(fn, max_batch=3, max_wait_ms=20)
+    futs = [b.submit(i) for i in range(7)]
+    gate.set()
+    assert [f.result(timeout=2) for f in futs] == list(range(7))
+    assert max(sizes) <= 3
+
+
+def test_fn_exception_fails_whole_batch(make):
+    def fn(xs): raise ValueError("boom")
+    b = make(fn, max_wait_ms=1)
+    with pytest.raises(ValueError, match="boom"):
+        b.submit(1).result(timeout=2)
+
+
+def test_short_result_list_fails_instead_of_hanging(make):
+    b = make(lambda xs: list(xs)[:-1], max_batch=4, max_wait_ms=50)
+    futs = [b.submit(i) for i in range(3)]
+    for f in futs:
+        with pytest.raises(RuntimeError, match="불일치"):
+            f.result(timeout=2)
+
+
+def test_queue_full_is_rejected(make):
+    gate = threading.Event()
+    def fn(xs):
+        gate.wait(2)
+        return list(xs)
+    b = make(fn, max_batch=1, max_wait_ms=0, max_queue=1)
+    first = b.submit(0)
+    # 워커가 첫 요청을 가져가 fn에서 대기하는 동안 대기열(1칸)을 채운다
+    while b.stats()["queue"]: pass
+    b.submit(1)
+    with pytest.raises(QueueFull):
+        b.submit(2)
+    assert b.stats()["rejected"] == 1
+    gate.set()
+    assert first.result(timeout=2) == 0
+
+
+def test_close_fails_queued_and_rejects_new(make):
+    gate = threading.Event()
+    def fn(xs):
+        gate.wait(2)
+        return list(xs)
+    b = make(fn, max_batch=1, max_wait_ms=0, max_queue=8)
+    running = b.submit(0)
+    while b.stats()["queue"]: pass
+    queued = [b.submit(i) for i in range(1, 4)]
+    b.close()  # 워커는 fn에서 대기 중이라 join이 시간 초과 -> 남은 요청은 close가 실패 처리
+    for f in queued:
+        with pytest.raises(RuntimeError, match="종료"):
+            f.result(timeout=2)
+    with pytest.raises(RuntimeError, match="종료"):
+        b.submit(9)
+    gate.set()
+    assert running.result(timeout=2) == 0
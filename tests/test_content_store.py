@@ -0,0 +1,136 @@
+# tests/test_content_store.py
+# 임시 매니페스트/미디어 폴더로 ContentStore·ThumbCache 동작 확인 (네트워크 없이)
+import os, json, time, base64
+from io import BytesIO
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from content_store import ContentStore, ThumbCache, yt_thumb
+
+VOCAB = ["alpha", "beta", "gamma"]
+REMOTE = "https://example.com/a.jpg"
+VIDEO = "https://www.youtube.com/watch?v=bHMxGDIVBxM"
+
+
+def _png(w=800, h=600, color=(200, 30, 30)) -> bytes:
+    buf = BytesIO()
+    Image.new("RGB", (w, h), color).save(buf, "PNG")
+    return buf.getvalue()
+
+
+def _data_uri(b: bytes) -> str:
+    return "data:image/png;base64," + base64.b64encode(b).decode()
+
+
+@pytest.fixture
+def media(tmp_path):
+    d = tmp_path / "media"
+    d.mkdir()
+    (d / "local.png").write_bytes(_png(color=(10, 120, 200)))
+    return tmp_path
+
+
+@pytest.fixture
+def thumbs(tmp_path):
+    tc = ThumbCache(str(tmp_path / "thumbs"), "/static/thumbs", max_side=64)
+    yield tc
+    tc._pool.shutdown(wait=True)
+
+
+def _store(root, manifest: dict, thumbs=None) -> ContentStore:
+    path = root / "labels.json"
+    path.write_text(json.dumps(manifest), encoding="utf-8")
+    return ContentStore(str(path), VOCAB, thumbs)
+
+
+def _file(thumbs: ThumbCache, url: str) -> str:
+    return os.path.join(thumbs.cache_dir, url.rsplit("/", 1)[1])
+
+
+def test_index_keys_map_to_vocab(media):
+    store = _store(media, {
+        "#0": {"texts": ["a0"]},
+        "#1": {"texts": ["b-index"]},
+        "beta": {"texts": ["b-name"]},  # 라벨명 키가 "#1"보다 우선
+        "#7": {"texts": ["out of range"]},
+    })
+    assert "alpha" in store and "beta" in store and "gamma" not in store
+    assert store.raw("alpha")["texts"] == ["a0"]
+    assert store.raw("beta")["texts"] == ["b-name"]
+    assert store.raw("gamma") == {"texts": [], "images": [], "videos": []}
+
+
+def test_raw_keeps_top3_non_empty(media):
+    store = _store(media, {"alpha": {"texts": ["1", " ", "2", None, "3", "4"]}})
+    assert store.raw("alpha")["texts"] == ["1", "2", "3"]
+
+
+def test_data_uri_and_local_file_become_thumbnails(media, thumbs):
+    store = _store(media, {"alpha": {"images": [_data_uri(_png()), "media/local.png"]}}, thumbs)
+    _, images, _ = store.get("alpha")
+    assert len(images) == 2
+    for url in images:
+        assert url.startswith("/static/thumbs/")
+        with Image.open(_file(thumbs, url)) as im:
+            assert im.format == "JPEG" and max(im.size) <= 64
+    # 두 번째 호출은 디스크 캐시를 그대로 사용
+    assert store.get("alpha")[1] == images
+
+
+def test_broken_data_uri_is_skipped(media, thumbs):
+    store = _store(media, {"alpha": {"images": ["data:image/png;base64,bm90IGFuIGltYWdl"]}}, thumbs)
+    assert store.get("alpha")[1] == []
+    assert thumbs.usage()["files"] == 0
+
+
+def test_remote_sources_return_original_url_then_cached(media, thumbs, monkeypatch):
+    calls = []
+    def fake_read(src, base_dir):
+        calls.append(src)
+        return _png(color=(0, 200, 0))
+    monkeypatch.setattr(thumbs, "_read_source", fake_read)
+    store = _store(media, {"alpha": {"images": [REMOTE], "videos": [VIDEO]}}, thumbs)
+
+    _, images, videos = store.get("alpha")
+    assert images == [REMOTE]                  # 백그라운드에서 받는 동안 원본 URL
+    assert videos == [(VIDEO, yt_thumb(VIDEO))]
+
+    thumbs._pool.shutdown(wait=True)
+    _, images, videos = store.get("alpha")
+    assert images[0].startswith("/static/thumbs/")
+    assert videos[0][1].startswith("/static/thumbs/")
+    assert sorted(calls) == sorted([REMOTE, yt_thumb(VIDEO)])  # 원본당 한 번만 받음
+
+
+def test_eviction_drops_least_recently_used(media, thumbs):
+    srcs = [_data_uri(_png(color=(i * 60, 0, 0))) for i in range(3)]
+    urls = [thumbs.get(s) for s in srcs]
+    paths = [_file(thumbs, u) for u in urls]
+    now = time.time()
+    for i, p in enumerate(paths):
+        os.utime(p, (now - 100 + i, now - 100 + i))  # 0이 가장 오래됨
+
+    thumbs.get(srcs[0])  # 다시 사용 -> 가장 최근
+    sizes = [os.path.getsize(p) for p in paths]
+    thumbs.max_bytes = sizes[0] + sizes[2]
+    with thumbs._lock:
+        thumbs._evict()
+    assert [os.path.exists(p) for p in paths] == [True, False, True]
+    assert thumbs.usage()["bytes"] <= thumbs.max_bytes
+
+
+def test_get_rebuilds_after_eviction(media, thumbs):
+    src = _data_uri(_png())
+    path = _file(thumbs, thumbs.get(src))
+    os.remove(path)  # 다른 스레드의 _evict가 지운 상황
+    assert thumbs.get(src) is not None and os.path.exists(path)
+
+
+def test_without_thumb_cache_uses_original_urls(media):
+    uri = _data_uri(_png())
+    store = _store(media, {"alpha": {"images": [REMOTE, uri, "media/local.png"], "videos": [VIDEO]}})
+    _, images, videos = store.get("alpha")
+    assert images == [REMOTE, uri]  # 로컬 파일은 정적 제공 경로가 없어 생략
+    assert videos == [(VIDEO, yt_thumb(VIDEO))]
@@ -0,0 +1,69 @@
+# tests/test_pred_cache.py
+# PredictionCache: LRU 순서, TTL 만료, 통계, 여러 스레드에서의 일관성
+import threading
+
+from pred_cache import PredictionCache, model_identity, image_key
+
+V = ("label", 0, [1.0])
+
+
+def test_lru_evicts_least_recently_used():
+    c = PredictionCache(max_items=2, ttl=None)
+    c.put("a", V); c.put("b", V)
+    assert c.get("a") == V          # a가 최근 -> b가 가장 오래됨
+    c.put("c", V)
+    assert c.get("b") is None and c.get("a") == V and c.get("c") == V
+    assert c.stats()["evictions"] == 1
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("pred_cache.time.monotonic", lambda: now[0])
+    c = PredictionCache(max_items=4, ttl=10)
+    c.put("a", V)
+    now[0] += 5
+    assert c.get("a") == V
+    now[0] += 6
+    assert c.get("a") is None
+    assert c.stats()["size"] == 0 and c.stats()["evictions"] == 1
+
+
+def test_get_or_compute_and_stats():
+    c = PredictionCache()
+    calls = []
+    fn = lambda: calls.append(1) or V
+    assert c.get_or_compute("k", fn) == (V, False)
+    assert c.get_or_compute("k", fn) == (V, True)
+    assert len(calls) == 1
+    s = c.stats()
+    assert (s["hits"], s["misses"], s["hit_rate"]) == (1, 1, 0.5)
+
+
+def test_zero_capacity_never_stores():
+    c = PredictionCache(max_items=0)
+    c.put("a", V)
+    assert c.get("a") is None and c.stats()["size"] == 0
+
+
+def test_concurrent_access_keeps_counts_consistent():
+    c = PredictionCache(max_items=16, ttl=None)
+    n_threads, n_ops = 8, 500
+    def work(t):
+        for i in range(n_ops):
+            c.get_or_compute(f"{(t * 7 + i) % 32}", lambda: V)
+    ths = [threading.Thread(target=work, args=(t,)) for t in range(n_threads)]
+    for th in ths: th.start()
+    for th in ths: th.join()
+    s = c.stats()
+    assert s["hits"] + s["misses"] == n_threads * n_ops
+    assert s["size"] <= 16
+
+
+def test_keys_depend_on_bytes_and_model(tmp_path):
+    p = tmp_path / "model.pkl"
+    p.write_bytes(b"v1")
+    m1 = model_identity(str(p))
+    assert image_key(b"x", m1) != image_key(b"y", m1)
+    p.write_bytes(b"v2-longer")
+    assert image_key(b"x", model_identity(str(p))) != image_key(b"x", m1)
+    assert model_identity(str(tmp_path / "nope")).endswith(":missing")